@@ -4,21 +4,134 @@ Test runner for cmdline library tests
 Feeds input to test programs and validates output
 """
 
+import argparse
+import functools
+import os
+import re
+import selectors
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Callable, List, Tuple, Optional, Sequence, Set, Union
+
+try:
+    import ahocorasick
+except ImportError:  # optional; large expectation sets fall back to regex
+    ahocorasick = None
+
+# Candidate directories holding the built test executables, in order
+TESTS_DIRS = (
+    Path(__file__).parent.parent / "build" / "tests",
+    Path(__file__).parent.parent.parent / "build" / "tests",
+)
+
+# Seconds a test executable may run before it is killed
+TEST_TIMEOUT = 5
+
+# CPUs this process may run on, used to pin concurrently launched tests.
+# Pinning needs a preexec_fn, which rules out posix_spawn, so it is opt-in
+# via CMDLINE_TEST_PIN_CPUS=1; empty where CPU affinity is unsupported.
+PIN_CPUS = os.environ.get("CMDLINE_TEST_PIN_CPUS", "") not in ("", "0")
+CPUS = (tuple(sorted(os.sched_getaffinity(0)))
+        if PIN_CPUS and hasattr(os, "sched_getaffinity") else ())
+
+# Expectation sets at least this large are matched with an Aho-Corasick
+# automaton when pyahocorasick is installed
+AHO_CORASICK_MIN_PATTERNS = 8
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_exe(name: str) -> Optional[Path]:
+    """Find a test executable in TESTS_DIRS, or None if it is not built"""
+    for tests_dir in TESTS_DIRS:
+        exe_path = tests_dir / name
+        if exe_path.exists():
+            return exe_path
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _matcher(expected: Tuple[bytes, ...]) -> Callable[[bytes], Set[bytes]]:
+    """Build a function returning which strings of expected occur in its input"""
+    if ahocorasick is not None and len(expected) >= AHO_CORASICK_MIN_PATTERNS:
+        # pyahocorasick wheels are built for str keys, so the UTF-8 bytes
+        # are mapped one-to-one onto characters through latin-1
+        automaton = ahocorasick.Automaton()
+        for s in expected:
+            automaton.add_word(s.decode("latin-1"), s)
+        automaton.make_automaton()
+        return lambda text: {s for _, s in automaton.iter(text.decode("latin-1"))}
+    
+    if len(expected) <= 2:
+        return lambda text: {s for s in expected if s in text}
+    
+    # Longest alternatives first, inside a lookahead so overlapping
+    # occurrences are still reported
+    patterns = sorted(set(expected), key=len, reverse=True)
+    pattern = re.compile(b"(?=(" + b"|".join(map(re.escape, patterns)) + b"))")
+    
+    def find(text: bytes) -> Set[bytes]:
+        found = {m.group(1) for m in pattern.finditer(text)}
+        # A string shadowed by a longer match at the same offset is a prefix
+        # of that match, so it is present too
+        return found | {
+            s for s in expected
+            if s not in found and any(s in f for f in found)
+        }
+    return find
+
+
+def _first_missing(expected: Sequence[bytes], text: bytes) -> Optional[bytes]:
+    """Return the first string of expected that does not occur in text"""
+    found = _matcher(tuple(expected))(text)
+    return next((s for s in expected if s not in found), None)
+
+
+@dataclass(frozen=True, slots=True)
+class TestSpec:
+    """A test executable and the output it is expected to produce"""
+    executable: str
+    label: str
+    expected_output: Tuple[str, ...]
+    expected_errors: Tuple[str, ...] = ()
+    args: Tuple[str, ...] = ()
+    # Lines fed to stdin; specs with commands run via run_interactive_test
+    commands: Tuple[str, ...] = ()
+    
+    # UTF-8 encoded expectations, matched directly against the raw output;
+    # expected strings may span any number of lines
+    expected_output_b: Tuple[bytes, ...] = field(init=False, repr=False, compare=False)
+    expected_errors_b: Tuple[bytes, ...] = field(init=False, repr=False, compare=False)
+    
+    # commands joined into the encoded stdin payload
+    input_bytes: bytes = field(init=False, repr=False, compare=False)
+    
+    # Resolved once at construction; None if the executable is not built
+    exe_path: Optional[Path] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "expected_output_b",
+                           tuple(s.encode() for s in self.expected_output))
+        object.__setattr__(self, "expected_errors_b",
+                           tuple(s.encode() for s in self.expected_errors))
+        object.__setattr__(self, "input_bytes",
+                           ("\n".join(self.commands) + "\n").encode()
+                           if self.commands else b"")
+        object.__setattr__(self, "exe_path", _resolve_exe(self.executable))
 
-# Base directory for tests
-TESTS_DIR = Path(__file__).parent.parent / "build" / "tests"
-if not TESTS_DIR.exists():
-    TESTS_DIR = Path(__file__).parent.parent.parent / "build" / "tests"
 
 class TestResult:
-    def __init__(self, name: str, passed: bool, message: str = ""):
+    __slots__ = ("name", "passed", "message", "progress")
+    
+    def __init__(self, name: str, passed: bool, message: str = "",
+                 progress: str = ""):
         self.name = name
         self.passed = passed
         self.message = message
+        self.progress = progress
     
     def __str__(self):
         status = "✓ PASS" if self.passed else "✗ FAIL"
@@ -26,101 +139,252 @@ class TestResult:
         return f"{status}: {self.name}{msg}"
 
 
-def run_test(executable: str, expected_output: List[str], 
-             expected_errors: Optional[List[str]] = None) -> TestResult:
-    """Run a test executable and check for expected output"""
-    exe_path = TESTS_DIR / executable
+def start_test(spec: TestSpec,
+               cpu: Optional[int] = None) -> Union[subprocess.Popen, TestResult]:
+    """Launch a test executable, optionally pinned to cpu, without waiting"""
+    executable = spec.executable
+    exe_path = spec.exe_path
     
-    if not exe_path.exists():
-        return TestResult(executable, False, f"Executable not found: {exe_path}")
+    if exe_path is None:
+        searched = " or ".join(str(d / executable) for d in TESTS_DIRS)
+        return TestResult(executable, False, f"Executable not found: {searched}")
     
+    # Only pipe the streams that are checked; the rest never reach Python
     try:
-        result = subprocess.run(
-            [str(exe_path)],
-            capture_output=True,
-            text=True,
-            timeout=5
+        return subprocess.Popen(
+            [str(exe_path), *spec.args],
+            stdout=subprocess.PIPE if spec.expected_output else subprocess.DEVNULL,
+            stderr=subprocess.PIPE if spec.expected_errors else subprocess.DEVNULL,
+            close_fds=False,
+            preexec_fn=(None if cpu is None
+                        else lambda: os.sched_setaffinity(0, {cpu}))
         )
+    except (OSError, subprocess.SubprocessError) as e:
+        return TestResult(executable, False, f"Exception: {str(e)}")
+
+
+def _kill(proc: subprocess.Popen) -> None:
+    """Kill a timed-out test and reap it without waiting for its pipes"""
+    # A descendant may still hold the pipes open, so waiting for EOF (as
+    # communicate() does) could outlast TEST_TIMEOUT
+    proc.kill()
+    for stream in (proc.stdin, proc.stdout, proc.stderr):
+        if stream is not None:
+            stream.close()
+    proc.wait()
+
+
+def _stream_matcher(expected: Tuple[bytes, ...],
+                    remaining: Set[bytes]) -> Tuple[Callable[[bytes], Set[bytes]], int]:
+    """Return the matcher for the remaining strings and the overlap it needs"""
+    pending = tuple(s for s in expected if s in remaining)
+    return _matcher(pending), max(map(len, pending), default=1) - 1
+
+
+def finish_test(spec: TestSpec,
+                handle: Union[subprocess.Popen, TestResult]) -> TestResult:
+    """Wait for a test started by start_test and check for expected output"""
+    if isinstance(handle, TestResult):
+        return handle
+    
+    executable = spec.executable
+    deadline = time.monotonic() + TEST_TIMEOUT
+    
+    # Match stdout chunk by chunk as it streams in, until every expected
+    # string has been seen. Each chunk is matched together with the tail
+    # of the output before it, one byte shorter than the longest expected
+    # string, so a match split across reads (or lines) is still found.
+    expected_output = spec.expected_output_b
+    remaining = set(expected_output)
+    find, overlap = _stream_matcher(expected_output, remaining)
+    tail = b""
+    stderr_chunks = []
+    
+    try:
+        # Drain both pipes together so a child blocked on a full stderr
+        # pipe cannot stall the stdout reads
+        with selectors.DefaultSelector() as selector:
+            for stream in (handle.stdout, handle.stderr):
+                if stream is not None:
+                    selector.register(stream, selectors.EVENT_READ)
+            
+            while selector.get_map():
+                timeout = deadline - time.monotonic()
+                ready = selector.select(timeout) if timeout > 0 else []
+                if not ready:
+                    _kill(handle)
+                    return TestResult(executable, False, "Test timed out")
+                
+                for key, _ in ready:
+                    chunk = os.read(key.fd, 32768)
+                    if not chunk:
+                        selector.unregister(key.fileobj)
+                    elif key.fileobj is handle.stderr:
+                        stderr_chunks.append(chunk)
+                    elif remaining:
+                        window = tail + chunk
+                        found = find(window)
+                        if found:
+                            # Narrow the search to what is still missing
+                            remaining -= found
+                            find, overlap = _stream_matcher(expected_output, remaining)
+                        tail = window[-overlap:] if overlap else b""
+                    # Once everything has matched, stdout is only drained
         
-        stdout = result.stdout
-        stderr = result.stderr
+        # Both pipes are closed, so the process should be exiting
+        try:
+            handle.wait(timeout=max(0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            _kill(handle)
+            return TestResult(executable, False, "Test timed out")
         
         # Check expected output
-        for expected in expected_output:
-            if expected not in stdout:
-                return TestResult(
-                    executable, False, 
-                    f"Expected '{expected}' not found in stdout"
-                )
+        missing = next((s for s in expected_output if s in remaining), None)
+        if missing is not None:
+            return TestResult(
+                executable, False, 
+                f"Expected '{missing.decode()}' not found in stdout"
+            )
         
         # Check expected errors
-        if expected_errors:
-            for expected_err in expected_errors:
-                if expected_err not in stderr:
-                    return TestResult(
-                        executable, False,
-                        f"Expected error '{expected_err}' not found in stderr"
-                    )
+        if spec.expected_errors_b:
+            missing = _first_missing(spec.expected_errors_b, b"".join(stderr_chunks))
+            if missing is not None:
+                return TestResult(
+                    executable, False,
+                    f"Expected error '{missing.decode()}' not found in stderr"
+                )
         
         return TestResult(executable, True)
         
-    except subprocess.TimeoutExpired:
-        return TestResult(executable, False, "Test timed out")
-    except Exception as e:
+    except (OSError, subprocess.SubprocessError) as e:
+        _kill(handle)
         return TestResult(executable, False, f"Exception: {str(e)}")
 
 
-def run_interactive_test(executable: str, commands: List[str],
-                         expected_outputs: List[str]) -> TestResult:
+def run_interactive_test(spec: TestSpec) -> TestResult:
     """Run a test with interactive input"""
-    exe_path = TESTS_DIR / executable
+    executable = spec.executable
+    exe_path = spec.exe_path
     
-    if not exe_path.exists():
-        return TestResult(executable, False, f"Executable not found: {exe_path}")
+    if exe_path is None:
+        searched = " or ".join(str(d / executable) for d in TESTS_DIRS)
+        return TestResult(executable, False, f"Executable not found: {searched}")
     
     try:
-        # Join commands with newlines
-        input_data = '\n'.join(commands) + '\n'
-        
-        result = subprocess.run(
-            [str(exe_path)],
-            input=input_data,
-            capture_output=True,
-            text=True,
-            timeout=5
+        proc = subprocess.Popen(
+            [str(exe_path), *spec.args],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE if spec.expected_errors else subprocess.DEVNULL,
+            close_fds=False
         )
-        
-        stdout = result.stdout
+        try:
+            stdout, stderr = proc.communicate(input=spec.input_bytes,
+                                              timeout=TEST_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            _kill(proc)
+            raise
         
         # Check each expected output
-        for expected in expected_outputs:
-            if expected not in stdout:
+        missing = _first_missing(spec.expected_output_b, stdout)
+        if missing is not None:
+            return TestResult(
+                executable, False,
+                f"Expected '{missing.decode()}' not found in output"
+            )
+        
+        # Check expected errors
+        if spec.expected_errors_b:
+            missing = _first_missing(spec.expected_errors_b, stderr)
+            if missing is not None:
                 return TestResult(
                     executable, False,
-                    f"Expected '{expected}' not found in output"
+                    f"Expected error '{missing.decode()}' not found in stderr"
                 )
         
         return TestResult(executable, True)
         
     except subprocess.TimeoutExpired:
         return TestResult(executable, False, "Test timed out")
-    except Exception as e:
+    except (OSError, subprocess.SubprocessError) as e:
         return TestResult(executable, False, f"Exception: {str(e)}")
 
 
-def main():
-    print("=" * 60)
-    print("cmdline Library Test Suite")
-    print("=" * 60)
-    print()
+def run_test(spec: TestSpec,
+             handle: Union[subprocess.Popen, TestResult, None] = None) -> TestResult:
+    """Run a test executable and check for expected output"""
+    if spec.commands:
+        result = run_interactive_test(spec)
+    else:
+        result = finish_test(spec, handle if handle is not None else start_test(spec))
+    result.progress = f"Running {spec.label} tests..."
+    return result
+
+
+def run_tests(specs: Sequence[TestSpec],
+              verbose: bool = False) -> List[TestResult]:
+    """Run specs concurrently, returning their results in spec order"""
+    # Without posix_spawn every launch pays for a full fork of this process
+    if not subprocess._USE_POSIX_SPAWN:
+        print("Warning: posix_spawn unavailable, tests start via fork/exec",
+              file=sys.stderr)
+    elif CPUS:
+        print("Warning: CPU pinning enabled, tests start via fork/exec",
+              file=sys.stderr)
+    
+    # Launch every executable back-to-back so the OS overlaps their work,
+    # pinning each to one of the available CPUs. Interactive specs are
+    # started on their worker instead, which feeds their stdin.
+    handles = []
+    for i, spec in enumerate(specs):
+        if verbose:
+            print(f"Running {spec.label} tests...")
+        cpu = CPUS[i % len(CPUS)] if CPUS else None
+        handles.append(None if spec.commands else start_test(spec, cpu))
+    
+    # Drain and validate the running processes on worker threads
+    max_workers = max(1, (os.cpu_count() or 1) - 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(run_test, spec, handle)
+            for spec, handle in zip(specs, handles)
+        ]
+        
+        if verbose:
+            spec_of = dict(zip(futures, specs))
+            for future in as_completed(futures):
+                print(f"Finished {spec_of[future].label} tests")
+        
+        # Collect in submission order so the report stays stable
+        results = [future.result() for future in futures]
+    
+    # Print buffered progress in spec order so worker output never interleaves
+    if not verbose:
+        sys.stdout.write("".join(f"{r.progress}\n" for r in results))
+    return results
+
+
+def report(results: Sequence[TestResult]) -> int:
+    """Print the results summary and return the process exit code"""
+    passed = sum(1 for r in results if r.passed)
+    total = len(results)
     
-    results = []
+    # Build the whole summary first so it goes out in a single write
+    sys.stdout.write(
+        "\n" + "=" * 60 + "\nTest Results\n" + "=" * 60 + "\n"
+        + "".join(f"{result}\n" for result in results)
+        + f"\nTotal: {passed}/{total} tests passed\n"
+    )
     
+    return 0 if passed == total else 1
+
+
+TESTS = (
     # Test 1: Parse Failure Detection
-    print("Running parse failure tests...")
-    results.append(run_test(
-        "test_parse_fail",
-        expected_output=[
+    TestSpec(
+        "test_parse_fail", "parse failure",
+        expected_output=(
             "Test 1: Valid option",
             "Handler executed successfully!",
             "Result: success",
@@ -128,101 +392,93 @@ def main():
             "Result: failure",
             "Test 3: Mix of valid and invalid",
             "Result: failure"
-        ],
-        expected_errors=[
-            "Error: Unknown option '--invalid'"
-        ]
-    ))
-    
+        ),
+        expected_errors=(
+            "Error: Unknown option '--invalid'",
+        )
+    ),
+
     # Test 2: Int Range Validation
-    print("Running int range validation tests...")
-    results.append(run_test(
-        "test_int_range",
-        expected_output=[
+    TestSpec(
+        "test_int_range", "int range validation",
+        expected_output=(
             "IntOption Range Validation Demo",
             "Test 1: All values within range",
             "Port: 8080",
             "Percentage: 75%",
             "Temperature: 25°C"
-        ]
-    ))
-    
+        )
+    ),
+
     # Test 3: Array Range Validation
-    print("Running array range validation tests...")
-    results.append(run_test(
-        "test_array_range",
-        expected_output=[
+    TestSpec(
+        "test_array_range", "array range validation",
+        expected_output=(
             "IntArrayOption Range Validation Demo",
             "Test 1: All port values within valid range",
             "Ports: [80, 443, 8080, 3000]"
-        ]
-    ))
-    
+        )
+    ),
+
     # Test 4: Typed Options
-    print("Running typed options tests...")
-    results.append(run_test(
-        "test_typed_options",
-        expected_output=[
+    TestSpec(
+        "test_typed_options", "typed options",
+        expected_output=(
             "Typed Options and Composition Demo",
             "Test 1: Single value options",
             "Connecting to: example.com",
             "Port: 8080"
-        ]
-    ))
-    
+        )
+    ),
+
     # Test 5: Parse and Invoke
-    print("Running parse and invoke tests...")
-    results.append(run_test(
-        "test_parse_invoke",
-        expected_output=[
+    TestSpec(
+        "test_parse_invoke", "parse and invoke",
+        expected_output=(
             "Demonstrating Separated Parse and Invoke",
             "Test 1: Using execute() - single call",
             "[HANDLER] Connecting to: 192.168.1.1",
             "[HANDLER] Port: 8080"
-        ]
-    ))
-    
+        )
+    ),
+
     # Test 6: Constexpr Features
-    print("Running constexpr tests...")
-    results.append(run_test(
-        "constexpr_test",
-        expected_output=[
+    TestSpec(
+        "constexpr_test", "constexpr",
+        expected_output=(
             "Compile-time computed indices:",
             "help: 0",
             "exit: 1",
             "Runtime search for 'exit': 1"
-        ]
-    ))
-    
+        )
+    ),
+
     # Test 7: Default Values
-    print("Running default values tests...")
-    results.append(run_test(
-        "test_default_values",
-        expected_output=[
+    TestSpec(
+        "test_default_values", "default values",
+        expected_output=(
             "Default Value Creation Test",
             "Test 1: IntOption default value",
             "Default int64_t value: 0",
             "✓ Correct type and value"
-        ]
-    ))
-    
+        )
+    ),
+
     # Test 8: Subcommands
-    print("Running subcommands tests...")
-    results.append(run_test(
-        "test_subcommands",
-        expected_output=[
+    TestSpec(
+        "test_subcommands", "subcommands",
+        expected_output=(
             "Subcommand Support Demo",
             "Test 1: Show main help",
             "git: Git version control system",
             "Available subcommands:"
-        ]
-    ))
+        )
+    ),
 
     # Test 9: Comprehensive Coverage
-    print("Running comprehensive coverage tests...")
-    results.append(run_test(
-        "test_comprehensive_coverage",
-        expected_output=[
+    TestSpec(
+        "test_comprehensive_coverage", "comprehensive coverage",
+        expected_output=(
             "Comprehensive Coverage Tests",
             "Test 1: OptionGroup visitOption",
             "Test 2: IntOption range validation edge cases",
@@ -252,14 +508,13 @@ def main():
             "Test 26: OptionGroup size() function",
             "Test 27: Non-existent option lookups",
             "All comprehensive tests passed!"
-        ]
-    ))
+        )
+    ),
 
     # Test 10: Full Coverage
-    print("Running full coverage tests...")
-    results.append(run_test(
-        "test_full_coverage",
-        expected_output=[
+    TestSpec(
+        "test_full_coverage", "full coverage",
+        expected_output=(
             "Full Coverage Tests",
             "Test 1: Type traits coverage",
             "Test 2: CommandSpec findOption and numOptions",
@@ -287,107 +542,71 @@ def main():
             "Test 24: getAllOptions returns correct info",
             "Test 25: Unique partial match success",
             "All full coverage tests passed!"
-        ]
-    ))
+        )
+    ),
 
     # Test 11: Interactive CLI demo (with --test flag for automated mode)
-    print("Running interactive CLI demo tests...")
-    exe_path = TESTS_DIR / "test_interactive_cli"
-    if exe_path.exists():
-        try:
-            result = subprocess.run(
-                [str(exe_path), "--test"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            stdout = result.stdout
-
-            expected = [
-                "Interactive CLI Demo",
-                "Running in test mode...",
-                "default> help",
-                "Available commands: git, docker, config",
-                "default> gi?",
-                "-> git",
-                "default> git",
-                "Entering git mode...",
-                "git> ad?",
-                "-> add",
-                "git> status",
-                "[git status]",
-                "On branch main",
-                "git> add files main.cpp test.cpp utils.h",
-                "[git add] Staging files:",
-                "+ main.cpp",
-                "+ test.cpp",
-                "+ utils.h",
-                "git> commit message",
-                "[git commit]",
-                'Message: "Initial commit"',
-                "Verbose: 1",
-                "git> mode docker",
-                "Switched to mode: docker",
-                "docker> ps",
-                "[docker ps]",
-                "docker> run image nginx name webserver ports 80 443",
-                "[docker run]",
-                "Image: nginx",
-                "Name: webserver",
-                "Ports: 80, 443",
-                "docker> mode config",
-                "Switched to mode: config",
-                "config> get key database.host",
-                "[config get]",
-                "database.host = <value>",
-                "config> set key app.debug value true",
-                "[config set]",
-                "app.debug = true",
-                "config> mode default",
-                "default> exit",
-                "Session ended.",
-                "Interactive CLI Demo completed!"
-            ]
-
-            all_found = True
-            missing = None
-            for exp in expected:
-                if exp not in stdout:
-                    all_found = False
-                    missing = exp
-                    break
-
-            if all_found:
-                results.append(TestResult("test_interactive_cli", True))
-            else:
-                results.append(TestResult(
-                    "test_interactive_cli", False,
-                    f"Expected '{missing}' not found in output"
-                ))
-        except subprocess.TimeoutExpired:
-            results.append(TestResult("test_interactive_cli", False, "Timed out"))
-        except Exception as e:
-            results.append(TestResult("test_interactive_cli", False, str(e)))
-    else:
-        results.append(TestResult(
-            "test_interactive_cli", False,
-            f"Executable not found: {exe_path}"
-        ))
-
-    print()
-    print("=" * 60)
-    print("Test Results")
-    print("=" * 60)
+    TestSpec(
+        "test_interactive_cli", "interactive CLI demo",
+        args=("--test",),
+        expected_output=(
+            "Interactive CLI Demo",
+            "Running in test mode...",
+            "default> help",
+            "Available commands: git, docker, config",
+            "default> gi?",
+            "-> git",
+            "default> git",
+            "Entering git mode...",
+            "git> ad?",
+            "-> add",
+            "git> status",
+            "[git status]",
+            "On branch main",
+            "git> add files main.cpp test.cpp utils.h",
+            "[git add] Staging files:",
+            "+ main.cpp",
+            "+ test.cpp",
+            "+ utils.h",
+            "git> commit message",
+            "[git commit]",
+            'Message: "Initial commit"',
+            "Verbose: 1",
+            "git> mode docker",
+            "Switched to mode: docker",
+            "docker> ps",
+            "[docker ps]",
+            "docker> run image nginx name webserver ports 80 443",
+            "[docker run]",
+            "Image: nginx",
+            "Name: webserver",
+            "Ports: 80, 443",
+            "docker> mode config",
+            "Switched to mode: config",
+            "config> get key database.host",
+            "[config get]",
+            "database.host = <value>",
+            "config> set key app.debug value true",
+            "[config set]",
+            "app.debug = true",
+            "config> mode default",
+            "default> exit",
+            "Session ended.",
+            "Interactive CLI Demo completed!"
+        )
+    ),
+)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the cmdline library tests")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="print progress as each test starts and finishes")
+    args = parser.parse_args(argv)
     
-    for result in results:
-        print(result)
+    sys.stdout.write("=" * 60 + "\ncmdline Library Test Suite\n" + "=" * 60 + "\n\n")
     
-    print()
-    passed = sum(1 for r in results if r.passed)
-    total = len(results)
-    print(f"Total: {passed}/{total} tests passed")
-    
-    return 0 if passed == total else 1
+    return report(run_tests(TESTS, verbose=args.verbose))
 
 
 if __name__ == "__main__":